@@ -20,11 +20,15 @@ import subprocess
 import sys
 import os
 import shutil
+import signal
 import threading
 import time
 import argparse
-import webbrowser
 import io
+import json
+import functools
+from collections import deque, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Fix Windows console encoding for Unicode
@@ -35,9 +39,35 @@ if sys.platform == "win32":
 # ── Constants ────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).parent.resolve()
 SRC_TAURI = PROJECT_ROOT / "src-tauri"
+PROJECT_ROOT_STR = str(PROJECT_ROOT)
+SRC_TAURI_STR = str(SRC_TAURI)
 VITE_URL = "http://localhost:1420"
+OUTPUT_FLUSH_MS = 50  # dashboard output batching interval
 VAD_MODEL_URL = "https://blob.handy.computer/silero_vad_v4.onnx"
 VAD_MODEL_PATH = SRC_TAURI / "resources" / "models" / "silero_vad_v4.onnx"
+IO_CHUNK_SIZE = 1 << 20  # 1 MiB buffer for model downloads and hashing
+VAD_MODEL_SHA256 = "a35ebf52fd3ce5f1469b2a36158dba761bc47b973ea3382b3186ca15b1f5af28"
+BUN_MANIFESTS = (
+    PROJECT_ROOT / "package.json",
+    PROJECT_ROOT / "bun.lock",
+    PROJECT_ROOT / "bun.lockb",
+)
+BUN_INSTALL_STAMP = PROJECT_ROOT / "node_modules" / ".bun-install-stamp"
+PREREQ_CACHE_PATH = Path.home() / ".cache" / "voice-input" / "prereqs.json"
+PREREQ_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Commands shared by the CLI runners and the dashboard buttons.
+# eslint and tsc keep incremental state under node_modules/.cache, so repeat
+# runs (e.g. dashboard clicks) only re-check files that changed since the last.
+RUST_TEST_CMD = ("cargo", "test", "--lib")
+LINT_CMD = ("bun", "run", "lint", "--cache", "--cache-location", "node_modules/.cache/eslint/")
+TYPE_CHECK_CMD = (
+    "bun", "x", "tsc", "--noEmit",
+    "--incremental", "--tsBuildInfoFile", "node_modules/.cache/tsc/tsconfig.tsbuildinfo",
+)
+FORMAT_CHECK_CMD = ("bun", "run", "format:check")
+DEV_CMD = ("bun", "run", "dev")
+TAURI_DEV_CMD = ("bun", "run", "tauri", "dev")
 
 
 # ── Terminal Colors ──────────────────────────────────────────────────
@@ -50,34 +80,142 @@ class C:
     END = "\033[0m"
 
 
+# Plain output for pipes/CI logs and when NO_COLOR is set (https://no-color.org)
+if os.environ.get("NO_COLOR") or not sys.stdout.isatty():
+    for _name in ("GREEN", "YELLOW", "RED", "CYAN", "BOLD", "END"):
+        setattr(C, _name, "")
+
+# Status prefixes are built once rather than formatted on every call
+_OK_PREFIX = f"  {C.GREEN}[OK]{C.END} "
+_WARN_PREFIX = f"  {C.YELLOW}[!!]{C.END} "
+_ERR_PREFIX = f"  {C.RED}[ERR]{C.END} "
+_INFO_PREFIX = f"  {C.CYAN}[>>]{C.END} "
+_HEADER_RULE = f"{C.BOLD}{C.CYAN}{'-' * 60}{C.END}"
+
+# Status lines skip print()'s argument handling. Each line is a single write
+# so lines from the background download thread never interleave mid-line.
+_write = sys.stdout.write
+
+
 def ok(msg):
-    print(f"  {C.GREEN}[OK]{C.END} {msg}")
+    _write(_OK_PREFIX + msg + "\n")
 
 
 def warn(msg):
-    print(f"  {C.YELLOW}[!!]{C.END} {msg}")
+    _write(_WARN_PREFIX + msg + "\n")
 
 
 def err(msg):
-    print(f"  {C.RED}[ERR]{C.END} {msg}")
+    _write(_ERR_PREFIX + msg + "\n")
 
 
 def info(msg):
-    print(f"  {C.CYAN}[>>]{C.END} {msg}")
+    _write(_INFO_PREFIX + msg + "\n")
 
 
 def header(msg):
-    print(f"\n{C.BOLD}{C.CYAN}{'-' * 60}{C.END}")
-    print(f"  {C.BOLD}{msg}{C.END}")
-    print(f"{C.BOLD}{C.CYAN}{'-' * 60}{C.END}")
+    _write(f"\n{_HEADER_RULE}\n  {C.BOLD}{msg}{C.END}\n{_HEADER_RULE}\n")
 
 
 # ── Prerequisite Checks ─────────────────────────────────────────────
-def check_command(name, version_flag="--version"):
-    """Check if a command is available and return its version."""
-    path = shutil.which(name)
+_prereq_cache_lock = threading.Lock()
+
+
+def prereq_cache_enabled():
+    """The on-disk prerequisite cache can be disabled for CI."""
+    return os.environ.get("VOICE_INPUT_SKIP_PREREQ_CACHE") != "1"
+
+
+def load_prereq_cache():
+    """Load cached prerequisite versions, or an empty dict if unavailable."""
+    try:
+        with open(PREREQ_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_prereq_cache(cache):
+    """Atomically write the prerequisite cache; failures are not fatal."""
+    import tempfile
+
+    try:
+        PREREQ_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=PREREQ_CACHE_PATH.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, PREREQ_CACHE_PATH)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def path_index():
+    """Map lower-cased file names on PATH to their (PATH position, full path)."""
+    index = {}
+    for position, directory in enumerate(os.environ.get("PATH", "").split(os.pathsep)):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    index.setdefault(entry.name.lower(), []).append((position, entry.path))
+        except OSError:
+            continue
+    return index
+
+
+def find_executable(name):
+    """Locate an executable on PATH, like shutil.which(name).
+
+    On Windows shutil.which stats every PATHEXT variant in every PATH
+    directory for each tool, so PATH is listed once into path_index()
+    instead. Elsewhere a handful of stats is cheaper than listing PATH.
+    """
+    if sys.platform != "win32":
+        return shutil.which(name)
+
+    pathext = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").lower().split(";")
+    matches = []
+    for priority, ext in enumerate(filter(None, pathext)):
+        for position, path in path_index().get(name.lower() + ext, ()):
+            if os.path.isfile(path):
+                matches.append((position, priority, path))
+                break
+    # Earliest PATH directory wins, then PATHEXT order, as with shutil.which.
+    return min(matches)[2] if matches else None
+
+
+def check_command(name, version_flag="--version", refresh=False):
+    """Check if a command is available and return its version.
+
+    Versions are cached for PREREQ_CACHE_TTL as long as the command still
+    resolves to the same path; pass refresh=True to re-probe regardless.
+    """
+    path = find_executable(name)
     if not path:
         return None, None
+
+    use_cache = prereq_cache_enabled()
+    if use_cache and not refresh:
+        with _prereq_cache_lock:
+            entry = load_prereq_cache().get(name)
+        # Entries that don't match the expected shape (hand-edited or written
+        # by an older launcher) are treated as a cache miss.
+        if (
+            isinstance(entry, dict)
+            and entry.get("path") == path
+            and isinstance(entry.get("version"), str)
+            and isinstance(entry.get("checked_at"), (int, float))
+            and time.time() - entry["checked_at"] < PREREQ_CACHE_TTL
+        ):
+            return path, entry["version"]
+
     try:
         result = subprocess.run(
             [path, version_flag],
@@ -86,47 +224,52 @@ def check_command(name, version_flag="--version"):
             timeout=10,
         )
         version = (result.stdout.strip() or result.stderr.strip()).split("\n")[0]
-        return path, version
     except Exception:
         return path, "unknown"
 
+    if use_cache and result.returncode == 0:
+        with _prereq_cache_lock:
+            cache = load_prereq_cache()
+            cache[name] = {"path": path, "version": version, "checked_at": time.time()}
+            save_prereq_cache(cache)
+    return path, version
 
-def check_prerequisites():
-    """Check all required tools are installed."""
-    header("Checking Prerequisites")
 
-    all_ok = True
+# (name, label, message when missing, required)
+PREREQUISITES = [
+    ("rustc", "Rust", "Rust not found. Install from https://rustup.rs/", True),
+    ("cargo", "Cargo", "Cargo not found", True),
+    ("bun", "Bun", "Bun not found. Install from https://bun.sh/", True),
+    ("node", "Node.js", "Node.js not found (optional)", False),
+]
+ALL_TOOLS = tuple(name for name, *_ in PREREQUISITES)
 
-    # Rust
-    path, ver = check_command("rustc")
-    if path:
-        ok(f"Rust: {ver}")
-    else:
-        err("Rust not found. Install from https://rustup.rs/")
-        all_ok = False
 
-    # Cargo
-    path, ver = check_command("cargo")
-    if path:
-        ok(f"Cargo: {ver}")
-    else:
-        err("Cargo not found")
-        all_ok = False
+def check_prerequisites(tools=ALL_TOOLS, refresh=False):
+    """Check the given tools (all of them by default) are installed."""
+    header("Checking Prerequisites")
 
-    # Bun
-    path, ver = check_command("bun")
-    if path:
-        ok(f"Bun: {ver}")
-    else:
-        err("Bun not found. Install from https://bun.sh/")
-        all_ok = False
+    all_ok = True
 
-    # Node (optional, for some tools)
-    path, ver = check_command("node")
-    if path:
-        ok(f"Node.js: {ver}")
-    else:
-        warn("Node.js not found (optional)")
+    # The --version probes are independent subprocess waits, so run them
+    # concurrently and report in a fixed order once they have all finished.
+    found = {}
+    with ThreadPoolExecutor() as pool:
+        futures = {pool.submit(check_command, name, refresh=refresh): name for name in tools}
+        for future in as_completed(futures):
+            found[futures[future]] = future.result()
+
+    for name, label, missing_msg, required in PREREQUISITES:
+        if name not in found:
+            continue
+        path, ver = found[name]
+        if path:
+            ok(f"{label}: {ver}")
+        elif required:
+            err(missing_msg)
+            all_ok = False
+        else:
+            warn(missing_msg)
 
     # VAD Model
     if VAD_MODEL_PATH.exists():
@@ -140,17 +283,31 @@ def check_prerequisites():
 
 
 # ── Setup ────────────────────────────────────────────────────────────
-def install_dependencies():
+def dependencies_up_to_date():
+    """True if the last successful bun install is newer than every manifest."""
+    try:
+        stamp_mtime = BUN_INSTALL_STAMP.stat().st_mtime
+    except OSError:
+        return False
+    return all(not p.exists() or p.stat().st_mtime <= stamp_mtime for p in BUN_MANIFESTS)
+
+
+def install_dependencies(force=False):
     """Install frontend dependencies with Bun."""
     header("Installing Dependencies")
 
+    if not force and dependencies_up_to_date():
+        ok("Frontend dependencies up to date")
+        return True
+
     info("Running bun install...")
     result = subprocess.run(
         ["bun", "install"],
-        cwd=str(PROJECT_ROOT),
+        cwd=PROJECT_ROOT_STR,
         capture_output=False,
     )
     if result.returncode == 0:
+        BUN_INSTALL_STAMP.touch()
         ok("Frontend dependencies installed")
     else:
         err("Failed to install dependencies")
@@ -159,116 +316,282 @@ def install_dependencies():
     return True
 
 
-def download_vad_model():
-    """Download the VAD model if missing."""
+def file_sha256(path, chunk_size=IO_CHUNK_SIZE):
+    """Return the hex SHA-256 digest of a file, read in 1 MiB chunks."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def urllib_download(url, dest):
+    """Download url to dest with urllib, resuming a partial file if present."""
+    import urllib.error
+    import urllib.request
+
+    offset = dest.stat().st_size if dest.exists() else 0
+    request = urllib.request.Request(url)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+
+    try:
+        with urllib.request.urlopen(request) as resp:
+            # A 200 means the server ignored the Range header; start over.
+            mode = "ab" if resp.status == 206 else "wb"
+            with open(dest, mode) as f:
+                shutil.copyfileobj(resp, f, length=IO_CHUNK_SIZE)
+    except urllib.error.HTTPError as e:
+        # 416: nothing left past offset, the partial file is already complete.
+        if e.code != 416 or not offset:
+            raise
+
+
+def download_vad_model(quiet=False):
+    """Download the VAD model if missing or corrupt.
+
+    Returns (success, message); message is None if a verified model was
+    already in place. With quiet=True nothing is printed and the downloaders'
+    progress output is silenced, so the download can run alongside
+    `bun install`; the caller reports the result via report_vad_download().
+    """
+
+    def done(success, message):
+        if not quiet:
+            (ok if success else err)(message)
+        return success, message
+
     if VAD_MODEL_PATH.exists():
-        return True
+        if file_sha256(VAD_MODEL_PATH) == VAD_MODEL_SHA256:
+            return True, None
+        if not quiet:
+            warn(f"VAD model at {VAD_MODEL_PATH} failed checksum verification")
+        VAD_MODEL_PATH.unlink()
 
-    header("Downloading VAD Model")
-    info(f"Downloading from {VAD_MODEL_URL}...")
+    if not quiet:
+        header("Downloading VAD Model")
+        info(f"Downloading from {VAD_MODEL_URL}...")
 
     VAD_MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Download next to the final path and only move it into place once
+    # verified, so an interrupted download is never mistaken for the model.
+    part_path = VAD_MODEL_PATH.with_suffix(".onnx.part")
 
     try:
-        # Try with curl first (more reliable for large files)
+        # Prefer aria2c when installed: it fetches segments over parallel
+        # connections and, with -c, continues a leftover .part file. -k 1M
+        # lowers the 20M default minimum split size so the small model is
+        # actually split across connections.
+        downloaded = False
+        if shutil.which("aria2c"):
+            result = subprocess.run(
+                [
+                    "aria2c",
+                    "-x", "8",
+                    "-s", "8",
+                    "-k", "1M",
+                    "-c",
+                    "--auto-file-renaming=false",
+                    *(["--quiet"] if quiet else []),
+                    "-d", str(part_path.parent),
+                    "-o", part_path.name,
+                    VAD_MODEL_URL,
+                ],
+                capture_output=False,
+            )
+            downloaded = result.returncode == 0
+            if not downloaded:
+                # A segmented .part is not contiguous, so curl/urllib cannot
+                # resume it; start them from scratch instead.
+                part_path.unlink(missing_ok=True)
+                Path(f"{part_path}.aria2").unlink(missing_ok=True)
+
+        # Then curl (more reliable for large files than urllib); -C - resumes
+        # a leftover .part file and --fail rejects HTTP error pages.
         curl_path = shutil.which("curl")
-        if curl_path:
+        if curl_path and not downloaded:
             result = subprocess.run(
-                ["curl", "-L", "-o", str(VAD_MODEL_PATH), VAD_MODEL_URL],
+                [
+                    "curl",
+                    *(["-sS"] if quiet else []),
+                    "-L", "--fail",
+                    "-C", "-",
+                    "-o", str(part_path),
+                    VAD_MODEL_URL,
+                ],
                 capture_output=False,
             )
-            if result.returncode == 0:
-                ok(f"VAD model downloaded to {VAD_MODEL_PATH}")
-                return True
+            downloaded = result.returncode == 0
 
         # Fallback to Python's urllib
-        import urllib.request
-        urllib.request.urlretrieve(VAD_MODEL_URL, str(VAD_MODEL_PATH))
-        ok(f"VAD model downloaded to {VAD_MODEL_PATH}")
-        return True
+        if not downloaded:
+            urllib_download(VAD_MODEL_URL, part_path)
     except Exception as e:
-        err(f"Failed to download VAD model: {e}")
-        return False
+        return done(False, f"Failed to download VAD model: {e}")
 
+    if file_sha256(part_path) != VAD_MODEL_SHA256:
+        part_path.unlink()
+        return done(False, "Downloaded VAD model failed checksum verification")
 
-# ── Test Runners ─────────────────────────────────────────────────────
-def run_rust_tests():
-    """Run Rust unit tests."""
-    header("Running Rust Tests")
+    os.replace(part_path, VAD_MODEL_PATH)
+    return done(True, f"VAD model downloaded to {VAD_MODEL_PATH}")
 
-    result = subprocess.run(
-        ["cargo", "test", "--lib"],
-        cwd=str(SRC_TAURI),
-        capture_output=False,
-    )
 
-    if result.returncode == 0:
-        ok("All Rust tests passed!")
-    else:
-        err("Some Rust tests failed")
-    return result.returncode == 0
+def start_vad_model_download():
+    """Run a quiet download_vad_model on a background thread and return its Future.
 
+    The download and `bun install` touch disjoint paths, so callers start
+    this first, install dependencies, then pass the Future to
+    report_vad_download() so the outcome is printed from the main thread.
+    """
+    future = Future()
 
-def run_frontend_lint():
-    """Run frontend linting."""
-    header("Running Frontend Lint")
+    def worker():
+        try:
+            future.set_result(download_vad_model(quiet=True))
+        except Exception as e:
+            future.set_exception(e)
 
-    result = subprocess.run(
-        ["bun", "run", "lint"],
-        cwd=str(PROJECT_ROOT),
-        capture_output=False,
-    )
+    threading.Thread(target=worker, daemon=True).start()
+    return future
 
-    if result.returncode == 0:
-        ok("Frontend lint passed!")
-    else:
-        warn("Frontend lint had issues")
-    return result.returncode == 0
 
+def report_vad_download(future):
+    """Wait for a background VAD model download and print its outcome."""
+    try:
+        success, message = future.result()
+    except Exception as e:
+        success, message = False, f"Failed to download VAD model: {e}"
 
-def run_format_check():
-    """Check code formatting."""
-    header("Checking Code Format")
+    if message:
+        header("VAD Model")
+        (ok if success else err)(message)
+    return success
 
-    result = subprocess.run(
-        ["bun", "run", "format:check"],
-        cwd=str(PROJECT_ROOT),
-        capture_output=False,
-    )
 
-    if result.returncode == 0:
-        ok("Code format is correct!")
+# ── Test Runners ─────────────────────────────────────────────────────
+# (header, command, cwd, message on success, message on failure, failure reporter)
+CheckSpec = namedtuple("CheckSpec", "title cmd cwd passed_msg failed_msg on_fail")
+
+RUST_TESTS = CheckSpec(
+    title="Running Rust Tests",
+    cmd=RUST_TEST_CMD,
+    cwd=SRC_TAURI_STR,
+    passed_msg="All Rust tests passed!",
+    failed_msg="Some Rust tests failed",
+    on_fail=err,
+)
+FRONTEND_LINT = CheckSpec(
+    title="Running Frontend Lint",
+    cmd=LINT_CMD,
+    cwd=PROJECT_ROOT_STR,
+    passed_msg="Frontend lint passed!",
+    failed_msg="Frontend lint had issues",
+    on_fail=warn,
+)
+FORMAT_CHECK = CheckSpec(
+    title="Checking Code Format",
+    cmd=FORMAT_CHECK_CMD,
+    cwd=PROJECT_ROOT_STR,
+    passed_msg="Code format is correct!",
+    failed_msg="Code formatting issues found. Run: bun run format",
+    on_fail=warn,
+)
+TYPE_CHECK = CheckSpec(
+    title="Running TypeScript Type Check",
+    cmd=TYPE_CHECK_CMD,
+    cwd=PROJECT_ROOT_STR,
+    passed_msg="TypeScript types OK!",
+    failed_msg="TypeScript type errors found",
+    on_fail=warn,
+)
+
+
+def check_passed(spec, returncode):
+    """Print the outcome of a check and return whether it passed."""
+    if returncode == 0:
+        ok(spec.passed_msg)
     else:
-        warn("Code formatting issues found. Run: bun run format")
-    return result.returncode == 0
+        spec.on_fail(spec.failed_msg)
+    return returncode == 0
+
+
+def run_check(spec):
+    """Run a check command with its output streamed to the terminal."""
+    header(spec.title)
+    result = subprocess.run(spec.cmd, cwd=spec.cwd, capture_output=False)
+    return check_passed(spec, result.returncode)
+
+
+def capture_check(spec):
+    """Run a check command with its output captured for report_check()."""
+    return subprocess.run(
+        spec.cmd,
+        cwd=spec.cwd,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
 
 
-def run_type_check():
-    """Run TypeScript type checking."""
-    header("Running TypeScript Type Check")
+def report_check(spec, result):
+    """Print the captured output and outcome of a check run by capture_check()."""
+    header(spec.title)
+    if result.stdout:
+        sys.stdout.write(result.stdout)
+        sys.stdout.flush()
+    if result.stderr:
+        sys.stderr.write(result.stderr)
+        sys.stderr.flush()
+    return check_passed(spec, result.returncode)
 
-    result = subprocess.run(
-        ["bun", "x", "tsc", "--noEmit"],
-        cwd=str(PROJECT_ROOT),
-        capture_output=False,
-    )
 
-    if result.returncode == 0:
-        ok("TypeScript types OK!")
-    else:
-        warn("TypeScript type errors found")
-    return result.returncode == 0
+def run_rust_tests():
+    """Run Rust unit tests."""
+    return run_check(RUST_TESTS)
+
+
+def run_frontend_lint():
+    """Run frontend linting."""
+    return run_check(FRONTEND_LINT)
+
+
+def run_format_check():
+    """Check code formatting."""
+    return run_check(FORMAT_CHECK)
+
+
+def run_type_check():
+    """Run TypeScript type checking."""
+    return run_check(TYPE_CHECK)
 
 
 def run_all_tests():
     """Run all tests."""
     header("Running All Tests")
 
+    suites = [
+        ("Rust Tests", RUST_TESTS),
+        ("Frontend Lint", FRONTEND_LINT),
+        ("Type Check", TYPE_CHECK),
+        ("Format Check", FORMAT_CHECK),
+    ]
+
+    # The suites use disjoint toolchains, so run them side by side with
+    # captured output and print each transcript in a fixed order afterwards.
+    info("Running checks in parallel...")
+    captured = {}
+    with ThreadPoolExecutor(max_workers=len(suites)) as pool:
+        futures = {pool.submit(capture_check, spec): name for name, spec in suites}
+        for future in as_completed(futures):
+            captured[futures[future]] = future.result()
+
     results = {}
-    results["Rust Tests"] = run_rust_tests()
-    results["Frontend Lint"] = run_frontend_lint()
-    results["Type Check"] = run_type_check()
-    results["Format Check"] = run_format_check()
+    for name, spec in suites:
+        results[name] = report_check(spec, captured[name])
 
     header("Test Summary")
     all_passed = True
@@ -290,6 +613,8 @@ def run_all_tests():
 # ── Launchers ────────────────────────────────────────────────────────
 def launch_frontend_only():
     """Launch the Vite dev server (frontend only, no Tauri)."""
+    import webbrowser
+
     header("Launching Frontend Dev Server")
     info(f"Starting Vite at {VITE_URL}")
     info("Press Ctrl+C to stop")
@@ -303,8 +628,8 @@ def launch_frontend_only():
 
     try:
         subprocess.run(
-            ["bun", "run", "dev"],
-            cwd=str(PROJECT_ROOT),
+            DEV_CMD,
+            cwd=PROJECT_ROOT_STR,
         )
     except KeyboardInterrupt:
         info("Frontend server stopped")
@@ -319,18 +644,94 @@ def launch_tauri_dev():
 
     try:
         subprocess.run(
-            ["bun", "run", "tauri", "dev"],
-            cwd=str(PROJECT_ROOT),
+            TAURI_DEV_CMD,
+            cwd=PROJECT_ROOT_STR,
         )
     except KeyboardInterrupt:
         info("Tauri dev stopped")
 
 
 # ── Dashboard (tkinter) ─────────────────────────────────────────────
+def kill_process_tree(proc):
+    """Kill a process started in its own process group, along with its children.
+
+    Such processes are detached from the terminal's foreground group, so
+    Ctrl+C in the launcher's terminal does not reach them; whoever starts
+    them must call this on exit.
+    """
+    try:
+        if sys.platform == "win32":
+            subprocess.run(
+                ["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except OSError:
+        pass
+    proc.kill()
+
+
+def stream_command(cmd, cwd, on_line, timeout=300, running=None):
+    """Run a command, passing each line of combined output to on_line as it arrives.
+
+    Returns the exit code. The command and everything it spawned are killed and
+    subprocess.TimeoutExpired raised if it is still running after `timeout` seconds.
+
+    The command runs in its own process group, detached from the terminal, so
+    Ctrl+C does not stop it. If `running` is given, the Popen is kept in that
+    set while the command runs so the caller can kill_process_tree() it on exit.
+    """
+    # A process group of its own lets the timeout reach grandchildren too
+    # (eslint under bun, the test binary under cargo), which otherwise keep
+    # the output pipe open after the direct child is killed.
+    if sys.platform == "win32":
+        group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group_kwargs = {"start_new_session": True}
+
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+        **group_kwargs,
+    )
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        kill_process_tree(proc)
+
+    if running is not None:
+        running.add(proc)
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            on_line(line.rstrip("\n"))
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        if running is not None:
+            running.discard(proc)
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode
+
+
 def launch_dashboard():
     """Launch a simple tkinter dashboard for monitoring and testing."""
     try:
         import tkinter as tk
+        import webbrowser
         from tkinter import ttk, scrolledtext
     except ImportError:
         err("tkinter not available. Install python3-tk or use --test instead.")
@@ -382,50 +783,72 @@ def launch_dashboard():
     status_label = ttk.Label(root, textvariable=status_var, style="Status.TLabel")
     status_label.pack(fill=tk.X, padx=20, pady=(0, 5))
 
+    # Output is queued and inserted in batches by a periodic tick on the main
+    # loop, so long logs cost one redraw per tick instead of one per line.
+    # deque appends are thread-safe, so worker threads can write directly.
+    pending_output = deque()
+
     def write_output(text, tag=None):
-        output.insert(tk.END, text + "\n", tag)
-        output.see(tk.END)
-        root.update_idletasks()
+        pending_output.append((text + "\n", tag or ""))
+
+    def flush_output():
+        if pending_output:
+            chunks = []
+            while pending_output:
+                chunks.extend(pending_output.popleft())
+            output.insert(tk.END, *chunks)
+            output.see(tk.END)
+        root.after(OUTPUT_FLUSH_MS, flush_output)
 
     def clear_output():
+        pending_output.clear()
         output.delete(1.0, tk.END)
 
-    def run_in_thread(func, label):
-        def wrapper():
-            status_var.set(f"Running: {label}...")
-            clear_output()
-            write_output(f"{'=' * 50}")
-            write_output(f"  {label}")
-            write_output(f"{'=' * 50}\n")
+    # Commands started from the dashboard run detached from the terminal (see
+    # stream_command), so they are tracked here and killed when it closes.
+    running = set()
 
-            try:
-                result = subprocess.run(
-                    func,
-                    cwd=str(PROJECT_ROOT if "cargo" not in func else SRC_TAURI),
-                    capture_output=True,
-                    text=True,
-                    timeout=300,
-                )
-                if result.stdout:
-                    write_output(result.stdout)
-                if result.stderr:
-                    write_output(result.stderr)
+    def kill_running():
+        for proc in list(running):
+            kill_process_tree(proc)
 
-                if result.returncode == 0:
+    def close_dashboard():
+        kill_running()
+        root.destroy()
+
+    root.protocol("WM_DELETE_WINDOW", close_dashboard)
+
+    def on_ui(func, *args):
+        # Tk is not thread-safe: worker threads schedule updates on the main loop.
+        root.after(0, func, *args)
+
+    def run_in_thread(cmd, label, cwd):
+        status_var.set(f"Running: {label}...")
+        clear_output()
+        write_output(f"{'=' * 50}")
+        write_output(f"  {label}")
+        write_output(f"{'=' * 50}\n")
+
+        def wrapper():
+            try:
+                returncode = stream_command(cmd, cwd, write_output, running=running)
+                if returncode == 0:
                     write_output(f"\n✓ {label} — PASSED", "green")
-                    status_var.set(f"✓ {label} passed")
+                    on_ui(status_var.set, f"✓ {label} passed")
                 else:
-                    write_output(f"\n✗ {label} — FAILED (exit code {result.returncode})", "red")
-                    status_var.set(f"✗ {label} failed")
+                    write_output(f"\n✗ {label} — FAILED (exit code {returncode})", "red")
+                    on_ui(status_var.set, f"✗ {label} failed")
             except subprocess.TimeoutExpired:
                 write_output(f"\n! {label} — TIMEOUT", "yellow")
-                status_var.set(f"! {label} timed out")
+                on_ui(status_var.set, f"! {label} timed out")
             except Exception as e:
                 write_output(f"\n✗ Error: {e}", "red")
-                status_var.set(f"✗ Error running {label}")
+                on_ui(status_var.set, f"✗ Error running {label}")
 
         threading.Thread(target=wrapper, daemon=True).start()
 
+    flush_output()
+
     # Configure text tags for colors
     output.tag_configure("green", foreground="#a6e3a1")
     output.tag_configure("red", foreground="#f38ba8")
@@ -436,14 +859,18 @@ def launch_dashboard():
     btn_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
 
     buttons = [
-        ("Run Rust Tests", ["cargo", "test", "--lib"]),
-        ("Lint Frontend", ["bun", "run", "lint"]),
-        ("Type Check", ["bun", "x", "tsc", "--noEmit"]),
-        ("Format Check", ["bun", "run", "format:check"]),
+        ("Run Rust Tests", RUST_TEST_CMD, SRC_TAURI_STR),
+        ("Lint Frontend", LINT_CMD, PROJECT_ROOT_STR),
+        ("Type Check", TYPE_CHECK_CMD, PROJECT_ROOT_STR),
+        ("Format Check", FORMAT_CHECK_CMD, PROJECT_ROOT_STR),
     ]
 
-    for i, (label, cmd) in enumerate(buttons):
-        btn = ttk.Button(btn_frame, text=label, command=lambda c=cmd, l=label: run_in_thread(c, l))
+    for i, (label, cmd, cwd) in enumerate(buttons):
+        btn = ttk.Button(
+            btn_frame,
+            text=label,
+            command=lambda c=cmd, l=label, d=cwd: run_in_thread(c, l, d),
+        )
         btn.grid(row=0, column=i, padx=5, sticky=tk.EW)
         btn_frame.columnconfigure(i, weight=1)
 
@@ -462,55 +889,31 @@ def launch_dashboard():
             webbrowser.open(VITE_URL)
 
         threading.Thread(target=runner, daemon=True).start()
-        run_in_thread(["bun", "run", "dev"], "Vite Dev Server")
+        run_in_thread(DEV_CMD, "Vite Dev Server", PROJECT_ROOT_STR)
 
     def launch_tauri_btn():
         status_var.set("Building & launching Tauri app...")
         clear_output()
         write_output("Starting Tauri dev mode (this may take a few minutes)...\n")
-        run_in_thread(["bun", "run", "tauri", "dev"], "Tauri Dev")
+        run_in_thread(TAURI_DEV_CMD, "Tauri Dev", PROJECT_ROOT_STR)
 
     def run_all_btn():
         status_var.set("Running all checks...")
         clear_output()
 
-        def run_all_thread():
-            checks = [
-                ("Rust Tests", ["cargo", "test", "--lib"]),
-                ("Frontend Lint", ["bun", "run", "lint"]),
-                ("Type Check", ["bun", "x", "tsc", "--noEmit"]),
-            ]
-
-            results = {}
-            for label, cmd in checks:
-                write_output(f"\n{'─' * 40}")
-                write_output(f"  Running: {label}")
-                write_output(f"{'─' * 40}\n")
-                status_var.set(f"Running: {label}...")
-
-                try:
-                    result = subprocess.run(
-                        cmd,
-                        cwd=str(SRC_TAURI if "cargo" in cmd else PROJECT_ROOT),
-                        capture_output=True,
-                        text=True,
-                        timeout=300,
-                    )
-                    if result.stdout:
-                        write_output(result.stdout)
-                    if result.stderr:
-                        write_output(result.stderr)
-                    results[label] = result.returncode == 0
-                except Exception as e:
-                    write_output(f"Error: {e}", "red")
-                    results[label] = False
+        checks = [
+            ("Rust Tests", RUST_TEST_CMD, SRC_TAURI_STR),
+            ("Frontend Lint", LINT_CMD, PROJECT_ROOT_STR),
+            ("Type Check", TYPE_CHECK_CMD, PROJECT_ROOT_STR),
+        ]
 
+        def show_summary(results):
             write_output(f"\n{'═' * 50}")
             write_output("  Summary")
             write_output(f"{'═' * 50}\n")
 
-            for label, passed in results.items():
-                if passed:
+            for label, *_ in checks:
+                if results[label]:
                     write_output(f"  ✓ {label}", "green")
                 else:
                     write_output(f"  ✗ {label}", "red")
@@ -523,6 +926,37 @@ def launch_dashboard():
                 write_output(f"\n  Some checks failed.", "red")
                 status_var.set("✗ Some checks failed")
 
+        def stream_check(label, cmd, cwd):
+            # The checks run side by side, so tag each streamed line with its check.
+            try:
+                returncode = stream_command(
+                    cmd,
+                    cwd,
+                    lambda line: write_output(f"[{label}] {line}"),
+                    running=running,
+                )
+                results[label] = returncode == 0
+            except Exception as e:
+                write_output(f"[{label}] Error: {e}", "red")
+                results[label] = False
+
+        results = {}
+
+        def run_all_thread():
+            # Daemon threads rather than a ThreadPoolExecutor: pool workers are
+            # joined at interpreter exit, which would keep a closed dashboard
+            # alive until every check finished.
+            workers = [
+                threading.Thread(target=stream_check, args=check, daemon=True)
+                for check in checks
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            on_ui(show_summary, results)
+
+        write_output(f"Running {', '.join(label for label, *_ in checks)} in parallel...")
         threading.Thread(target=run_all_thread, daemon=True).start()
 
     buttons2 = [
@@ -537,7 +971,12 @@ def launch_dashboard():
         btn.grid(row=0, column=i, padx=5, sticky=tk.EW)
         btn_frame2.columnconfigure(i, weight=1)
 
-    root.mainloop()
+    try:
+        root.mainloop()
+    except KeyboardInterrupt:
+        info("Dashboard stopped")
+    finally:
+        kill_running()
 
 
 # ── Main ─────────────────────────────────────────────────────────────
@@ -569,14 +1008,31 @@ Examples:
     parser.add_argument(
         "--skip-checks", action="store_true", help="Skip prerequisite checks"
     )
+    parser.add_argument(
+        "--force-install",
+        action="store_true",
+        help="Run bun install even if node_modules looks up to date",
+    )
+    parser.add_argument(
+        "--refresh-checks",
+        action="store_true",
+        help="Ignore cached tool versions and re-run prerequisite checks",
+    )
 
     args = parser.parse_args()
 
     print(f"\n{C.BOLD}{C.CYAN}  Voice Input v0.8.0 -- Launcher{C.END}")
 
-    # Check prerequisites
+    # Check prerequisites, limited to the tools the selected mode needs
+    if args.test_rust:
+        tools = ("rustc", "cargo")
+    elif args.frontend and not (args.test or args.dashboard):
+        tools = ("bun",)
+    else:
+        tools = ALL_TOOLS
+
     if not args.skip_checks:
-        if not check_prerequisites():
+        if not check_prerequisites(tools, refresh=args.refresh_checks):
             err("Missing prerequisites. Install them and try again.")
             sys.exit(1)
 
@@ -590,19 +1046,21 @@ Examples:
         sys.exit(0 if success else 1)
 
     if args.dashboard:
-        install_dependencies()
-        download_vad_model()
+        vad_download = start_vad_model_download()
+        install_dependencies(force=args.force_install)
+        report_vad_download(vad_download)
         launch_dashboard()
         return
 
     if args.frontend:
-        install_dependencies()
+        install_dependencies(force=args.force_install)
         launch_frontend_only()
         return
 
     # Default: full Tauri dev launch
-    install_dependencies()
-    download_vad_model()
+    vad_download = start_vad_model_download()
+    install_dependencies(force=args.force_install)
+    report_vad_download(vad_download)
     launch_tauri_dev()
 
 